@@ -1,79 +1,391 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.animation import FuncAnimation
 import numpy as np
-from mpl_toolkits.mplot3d import Axes3D
-import itertools
 import re
-import threading
-import time
+import functools
+from collections import namedtuple
 import math
 
 
+# Operator symbols -> (precedence, right associative)
+OPERATORS = {
+    '~': (4, True),
+    '&': (3, False),
+    '|': (2, False),
+    '>': (1, True),
+    '=': (0, False),
+}
+
+# Multi-character keywords; '<->' must be tried before '->'
+_KW_MAP = {
+    'AND': '&',
+    'OR': '|',
+    'NOT': '~',
+    'IMPLIES': '>',
+    'IFF': '=',
+    '<->': '=',
+    '->': '>',
+}
+_KW_RE = re.compile('|'.join(re.escape(kw) for kw in _KW_MAP))
+
+_CHAR_TBL = str.maketrans({
+    '!': '~',
+    '∧': '&',
+    '∨': '|',
+    '¬': '~',
+    '→': '>',
+    '↔': '=',
+})
+
+# Whole-column NumPy implementations of each operator
+VECTOR_OPS = {
+    '~': np.logical_not,
+    '&': np.logical_and,
+    '|': np.logical_or,
+    '>': lambda a, b: np.logical_or(np.logical_not(a), b),
+    '=': np.equal,
+}
+
+# Opcodes of the flattened program run by the Numba kernel
+OP_AND, OP_OR, OP_NOT, OP_IMPLIES, OP_IFF, OP_VAR = range(6)
+OPCODES = {'&': OP_AND, '|': OP_OR, '~': OP_NOT, '>': OP_IMPLIES, '=': OP_IFF}
+
+# Opt-in Numba kernel for tables from NUMBA_MIN_VARS variables up. Off by default: up to
+# MAX_TABLE_VARS it measured slower than the NumPy path and its first call JIT-compiles
+USE_NUMBA = False
+NUMBA_MIN_VARS = 10
+
+# Above this many variables the table is not drawn, only analyzed
+MAX_TABLE_VARS = 16
+
+# From this many variables up, the hypercube is drawn as one uniform scatter per truth value
+HYPERCUBE_SPLIT_VARS = 8
+
+# Above this many variables the hypercube plots a fixed random sample of rows
+PLOT_SAMPLE_VARS = 12
+PLOT_SAMPLE_ROWS = 4096
+
+# Binary operation names indexed by r00 | r01 << 1 | r10 << 2 | r11 << 3,
+# i.e. bit i is the result of truth table row i
+BIN_OPS = (
+    "Contradiction (False)",
+    "Joint denial (NOR)",
+    "Converse non-implication",
+    "Negation (NOT A)",
+    "Material non-implication",
+    "Negation (NOT B)",
+    "Exclusive disjunction (XOR)",
+    "Alternative denial (NAND)",
+    "Conjunction (AND)",
+    "Biconditional (XNOR)",
+    "Second projection",
+    "Material implication",
+    "First projection",
+    "Converse implication",
+    "Disjunction (OR)",
+    "Tautology (True)",
+)
+
+# Plot color and marker size per truth value, indexed by the result column
+_TRUTH_PALETTE = np.array(['#F44336', '#4CAF50'])
+_SIZE_PALETTE_3D = np.array([200, 300])
+
+# The same colors as RGBA rows, so scatters do not parse a hex string per point
+_TRUTH_RGBA = np.array([[int(c[i:i + 2], 16) / 255 for i in (1, 3, 5)] + [1.0]
+                        for c in _TRUTH_PALETTE], dtype=np.float32)
+
+BITWISE_TEMPLATES = {
+    '&': "({0}&{1})",
+    '|': "({0}|{1})",
+    '>': "(~{0}|{1})",
+    '=': "~({0}^{1})",
+}
+
+
 class LogicalExpression:
     """Class to handle logical expression parsing and evaluation"""
 
     def __init__(self, expression):
         self.expression = expression.replace(' ', '')
-        self.variables = self.extract_variables()
-        self.parsed_expr = self.parse_expression()
-
-    def extract_variables(self):
-        """Extract unique variables from expression"""
-        # Find all single letters that aren't operators
-        vars_found = re.findall(r'[A-Za-z]', self.expression)
-        # Remove logical operators
-        operators = {'A', 'N', 'D', 'O', 'R', 'I', 'F', 'T', 'U', 'E'}
-        variables = set(var for var in vars_found if var not in operators)
-        return sorted(list(variables))
-
-    def parse_expression(self):
-        """Convert infix to postfix notation for easier evaluation"""
-        # Replace operators with symbols for easier parsing
-        expr = self.expression.upper()
-        expr = expr.replace('AND', '&')
-        expr = expr.replace('OR', '|')
-        expr = expr.replace('NOT', '~')
-        expr = expr.replace('IMPLIES', '>')
-        expr = expr.replace('IFF', '=')
-        expr = expr.replace('->', '>')
-        expr = expr.replace('<->', '=')
-        expr = expr.replace('!', '~')
-        expr = expr.replace('∧', '&')
-        expr = expr.replace('∨', '|')
-        expr = expr.replace('¬', '~')
-        expr = expr.replace('→', '>')
-        expr = expr.replace('↔', '=')
+        compiled = compile_expression(self.expression)
+        self.variables = list(compiled.variables)
+        self.parsed_expr = compiled.parsed_expr
+        self.bitwise_expr = compiled.bitwise_expr
+        self.evaluator = compiled.evaluator
+        self.vectorized = compiled.vectorized
+        self.postfix = compiled.postfix
+
+    @staticmethod
+    def extract_variables(parsed_expr):
+        """Extract unique variables from a parsed expression"""
+        # Operators are already symbols, so every remaining letter is a variable
+        mask = 0
+        for ch in parsed_expr:
+            if 'A' <= ch <= 'Z':
+                mask |= 1 << (ord(ch) - 65)
+        return [chr(65 + i) for i in range(26) if mask >> i & 1]
+
+    @staticmethod
+    def parse_expression(expression):
+        """Normalize operator keywords and symbols to single-character operators"""
+        # Replace operators with symbols in one scan per kind
+        expr = expression.upper().translate(_CHAR_TBL)
+        expr = _KW_RE.sub(lambda m: _KW_MAP[m.group(0)], expr)
 
         return expr
 
+    @staticmethod
+    def tokenize(parsed_expr, variables):
+        """Split the parsed expression into operator, parenthesis and variable tokens"""
+        tokens = []
+        for ch in parsed_expr:
+            if ch in OPERATORS or ch in '()':
+                tokens.append(ch)
+            elif ch in variables:
+                tokens.append(ch)
+            else:
+                raise ValueError(f"Unexpected symbol '{ch}'")
+        return tokens
+
+    @staticmethod
+    def to_postfix(tokens):
+        """Shunting-yard pass from infix tokens to postfix"""
+        output = []
+        stack = []
+        expect_operand = True
+
+        for tok in tokens:
+            if tok == '(' or tok == '~':
+                if not expect_operand:
+                    raise ValueError(f"Missing operator before '{tok}'")
+                stack.append(tok)
+            elif tok == ')':
+                if expect_operand:
+                    raise ValueError("Missing operand before ')'")
+                while stack and stack[-1] != '(':
+                    output.append(stack.pop())
+                if not stack:
+                    raise ValueError("Unbalanced parentheses")
+                stack.pop()
+            elif tok in OPERATORS:
+                if expect_operand:
+                    raise ValueError(f"Missing operand before '{tok}'")
+                prec, right_assoc = OPERATORS[tok]
+                while stack and stack[-1] != '(':
+                    top_prec = OPERATORS[stack[-1]][0]
+                    if top_prec > prec or (top_prec == prec and not right_assoc):
+                        output.append(stack.pop())
+                    else:
+                        break
+                stack.append(tok)
+                expect_operand = True
+            else:
+                if not expect_operand:
+                    raise ValueError(f"Missing operator before '{tok}'")
+                output.append(tok)
+                expect_operand = False
+
+        if expect_operand:
+            raise ValueError("Incomplete expression")
+        while stack:
+            tok = stack.pop()
+            if tok == '(':
+                raise ValueError("Unbalanced parentheses")
+            output.append(tok)
+        return output
+
+    @staticmethod
+    def to_bitwise(postfix):
+        """Rewrite postfix tokens as a Python expression over integer bit columns"""
+        stack = []
+        for tok in postfix:
+            if tok == '~':
+                stack.append(f"~{stack.pop()}")
+            elif tok in BITWISE_TEMPLATES:
+                right = stack.pop()
+                left = stack.pop()
+                stack.append(BITWISE_TEMPLATES[tok].format(left, right))
+            else:
+                stack.append(tok)
+        return stack[0]
+
+    @staticmethod
+    def compile_vectorized(postfix, variables):
+        """Compile postfix tokens to a function of a (rows, variables) bool matrix"""
+        column = {var: k for k, var in enumerate(variables)}
+        program = []  # (token, argument slots); slot i holds the value of program[i]
+        slots = {}    # repeated subexpressions map to the slot computed first
+        stack = []
+        for tok in postfix:
+            if tok == '~':
+                args = (stack.pop(),)
+            elif tok in VECTOR_OPS:
+                right = stack.pop()
+                args = (stack.pop(), right)
+            else:
+                args = ()
+            key = (tok,) + args
+            if key not in slots:
+                slots[key] = len(program)
+                program.append((tok, args))
+            stack.append(slots[key])
+        result_slot = stack[0]
+
+        def evaluate_columns(A):
+            values = []
+            for tok, args in program:
+                if args:
+                    values.append(VECTOR_OPS[tok](*[values[i] for i in args]))
+                else:
+                    values.append(A[:, column[tok]])
+            return values[result_slot]
+
+        return evaluate_columns
+
+    @staticmethod
+    def flatten_postfix(postfix, variables):
+        """Encode postfix tokens as (opcodes, operands) arrays; operands index variables"""
+        column = {var: k for k, var in enumerate(variables)}
+        opcodes = np.array([OPCODES.get(tok, OP_VAR) for tok in postfix], dtype=np.int8)
+        operands = np.array([column.get(tok, -1) for tok in postfix], dtype=np.int32)
+        return opcodes, operands
+
+    def evaluate_all(self):
+        """Evaluate every row at once; bit i of the result is the value of row i"""
+        n = len(self.variables)
+        mask = (1 << (1 << n)) - 1
+        cols = {var: self.column_bits(n, k) for k, var in enumerate(self.variables)}
+        return eval(self.evaluator, {'__builtins__': {}}, cols) & mask
+
+    @staticmethod
+    def column_bits(n, k):
+        """Bitvector for variable k of n: set on rows whose k-th most significant bit is 1"""
+        # Repeat a block of zeros then ones by doubling; avoids bigint division
+        block = 1 << (n - k - 1)
+        col = ((1 << block) - 1) << block
+        width = block << 1
+        total = 1 << n
+        while width < total:
+            col |= col << width
+            width <<= 1
+        return col
+
+    def evaluate_numpy(self):
+        """Evaluate every row at once; returns the uint8 assignments and bool results"""
+        n = len(self.variables)
+        combos = assignment_matrix(n)
+        kernel = numba_kernel() if USE_NUMBA and n >= NUMBA_MIN_VARS else None
+        if kernel is not None:
+            out = np.empty(1 << n, dtype=np.uint8)
+            # Only the opt-in kernel needs the flattened program, so it is built here
+            opcodes, operands = self.flatten_postfix(self.postfix, self.variables)
+            kernel(opcodes, operands, n, out)
+            return combos, out.view(bool)
+        return combos, self.vectorized(combos.view(bool))
+
     def evaluate(self, variable_values):
         """Evaluate expression given variable values"""
-        expr = self.parsed_expr
-
-        # Replace variables with their values
-        for var in self.variables:
-            expr = expr.replace(var, str(int(variable_values[var])))
-
-        # Replace logical operators with Python equivalents
-        expr = expr.replace('&', ' and ')
-        expr = expr.replace('|', ' or ')
-        expr = expr.replace('~', ' not ')
-        expr = expr.replace('>', ' <= ')  # A -> B is equivalent to not A or B
-        expr = expr.replace('=', ' == ')  # A <-> B is A == B
-
-        # Handle implications properly
-        expr = re.sub(r'(\d+)\s*<=\s*(\d+)', r'(not \1 or \2)', expr)
-
-        try:
-            # Convert 0/1 to boolean for evaluation
-            expr = expr.replace('1', 'True').replace('0', 'False')
-            result = eval(expr)
-            return int(result)
-        except:
-            return 0
+        # The compiled bitwise code works on 0/1 scalars; bit 0 holds the answer
+        return int(eval(self.evaluator, {'__builtins__': {}}, variable_values) & 1)
+
+
+CompiledExpression = namedtuple('CompiledExpression',
+                                ['variables', 'parsed_expr', 'bitwise_expr', 'evaluator',
+                                 'vectorized', 'postfix'])
+
+
+@functools.lru_cache(maxsize=128)
+def compile_expression(expr_str):
+    """Parse and compile an expression once; repeated expressions hit the cache"""
+    parsed_expr = LogicalExpression.parse_expression(expr_str)
+    variables = tuple(LogicalExpression.extract_variables(parsed_expr))
+    tokens = LogicalExpression.tokenize(parsed_expr, variables)
+    postfix = LogicalExpression.to_postfix(tokens)
+    bitwise_expr = LogicalExpression.to_bitwise(postfix)
+    evaluator = compile(bitwise_expr, '<expr>', 'eval')
+    vectorized = LogicalExpression.compile_vectorized(postfix, variables)
+    return CompiledExpression(variables, parsed_expr, bitwise_expr, evaluator, vectorized,
+                              tuple(postfix))
+
+
+@functools.lru_cache(maxsize=None)
+def assignment_matrix(n):
+    """All 2**n assignments as a read-only (2**n, n) uint8 matrix, memoized per n"""
+    # Big-endian row indices unpack to their bits, most significant first
+    row_bytes = np.arange(1 << n, dtype='>u4').view(np.uint8).reshape(-1, 4)
+    combos = np.unpackbits(row_bytes, axis=1)[:, 32 - n:]
+    combos.setflags(write=False)
+    return combos
+
+
+@functools.lru_cache(maxsize=None)
+def hypercube_weights(k):
+    """Read-only (k, 3) float32 matrix projecting the first k variables onto (x, y, z)"""
+    W = np.zeros((k, 3), dtype=np.float32)
+    W[:3] = [[1.0, 0.5, 0.2],
+             [0.5, 1.0, 0.2],
+             [0.2, 0.2, 1.0]]
+
+    # Add contribution from other variables
+    for i in range(3, k):
+        weight = 0.1 / (i - 1)
+        W[i] = (weight, weight * 0.7, weight * 0.3)
+
+    W.setflags(write=False)
+    return W
+
+
+@functools.lru_cache(maxsize=None)
+def plot_sample_rows(n):
+    """Sorted read-only row indices plotted for n variables, or None when every row is plotted"""
+    if n <= PLOT_SAMPLE_VARS:
+        return None
+    # Seeded so the same variable count always shows the same rows
+    rows = np.sort(np.random.default_rng(0).choice(1 << n, PLOT_SAMPLE_ROWS, replace=False))
+    rows.setflags(write=False)
+    return rows
+
+
+@functools.lru_cache(maxsize=None)
+def numba_kernel():
+    """Build the Numba row evaluator on first use; None when Numba is not installed"""
+    try:
+        from numba import njit, prange
+    except ImportError:  # Numba is optional; the NumPy path is used without it
+        return None
+
+    @njit(parallel=True, cache=True)
+    def _eval_rows_numba(opcodes, operands, n_vars, out):
+        """Run the flattened postfix program as a stack machine over every row index"""
+        n_rows = out.shape[0]
+        chunk = 4096
+        for c in prange((n_rows + chunk - 1) // chunk):
+            # uint8 on the boundary; one scratch stack per chunk of rows
+            stack = np.empty(opcodes.shape[0], dtype=np.uint8)
+            for i in range(c * chunk, min(n_rows, (c + 1) * chunk)):
+                sp = 0
+                for j in range(opcodes.shape[0]):
+                    op = opcodes[j]
+                    if op == OP_VAR:
+                        stack[sp] = (i >> (n_vars - 1 - operands[j])) & 1
+                        sp += 1
+                    elif op == OP_NOT:
+                        stack[sp - 1] = 1 - stack[sp - 1]
+                    else:
+                        b = stack[sp - 1]
+                        a = stack[sp - 2]
+                        sp -= 1
+                        if op == OP_AND:
+                            stack[sp - 1] = a & b
+                        elif op == OP_OR:
+                            stack[sp - 1] = a | b
+                        elif op == OP_IMPLIES:
+                            stack[sp - 1] = (1 - a) | b
+                        else:
+                            stack[sp - 1] = 1 if a == b else 0
+                out[i] = stack[0]
+
+    return _eval_rows_numba
 
 
 class EnhancedTreeview(ttk.Treeview):
@@ -82,11 +394,16 @@ class EnhancedTreeview(ttk.Treeview):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.highlighted_items = []
+        self._highlight_tags = {}
 
     def highlight_row(self, item, color="#4CAF50"):
         """Highlight a specific row"""
-        self.tag_configure('highlight', background=color, foreground='white')
-        self.item(item, tags=('highlight',))
+        # One tag per color, configured only the first time the color is used
+        tag = self._highlight_tags.get(color)
+        if tag is None:
+            tag = self._highlight_tags[color] = f'highlight{len(self._highlight_tags)}'
+            self.tag_configure(tag, background=color, foreground='white')
+        self.item(item, tags=(tag,))
         self.highlighted_items.append(item)
 
     def clear_highlights(self):
@@ -99,6 +416,12 @@ class EnhancedTreeview(ttk.Treeview):
 class TruthTableGenerator:
     """Main application class with enhanced GUI and visualizations"""
 
+    # Vertex index pairs of the unit cube, in truth table row order
+    CUBE_EDGES = np.array([
+        [0, 1], [0, 2], [0, 4], [1, 3], [1, 5], [2, 3],
+        [2, 6], [3, 7], [4, 5], [4, 6], [5, 7], [6, 7]
+    ])
+
     def __init__(self, root):
         self.root = root
         self.root.title("🎯 Advanced Truth Table Generator with 3D Visualizations")
@@ -108,12 +431,29 @@ class TruthTableGenerator:
         self.setup_theme()
 
         self.current_expression = None
-        self.truth_table_data = []
+        # Truth table as columns: assignments (rows x variables) and results (rows,)
+        self._assignments = np.empty((0, 0), dtype=np.uint8)
+        self._finalize_truth_table(np.empty(0, dtype=np.uint8))
         self.animation_running = False
-        self.animation_thread = None
+        self.animation_after_id = None
+        self._row_item_ids = []
+        self._anim_colors = ()
+        self._visible_rows = 1
+        self._last_seen_idx = -1
         self.animation_speed = 0.5  # seconds per step
         self.canvas = None
+        self._canvas_widget = None
         self.toolbar = None
+        self._fig = None
+        self._scatter3d = None
+        self._scatter_vars = 0
+
+        # matplotlib is imported lazily by _load_matplotlib
+        self._Figure = None
+        self._FigureCanvasTkAgg = None
+        self._NavigationToolbar2Tk = None
+        self._Line3DCollection = None
+        self._Poly3DCollection = None
 
         self.setup_gui()
 
@@ -319,6 +659,7 @@ class TruthTableGenerator:
         style.map('Treeview',
                   background=[('selected', '#00e5ff')],
                   foreground=[('selected', 'black')])
+        self._configure_tree_tags()
 
         # Right panel - Analysis
         right_panel = ttk.LabelFrame(content_frame, text="📈 Analysis & Visualization", padding=10)
@@ -356,6 +697,13 @@ class TruthTableGenerator:
                                             style="TProgressbar")
         self.progress_bar.pack(fill=tk.X, pady=(10, 0))
 
+    def _configure_tree_tags(self):
+        """Configure the static row color tags once"""
+        self.tree.tag_configure('true', background='#1B5E20', foreground='white')
+        self.tree.tag_configure('false', background='#B71C1C', foreground='white')
+        self.tree.tag_configure('summary', background='#37474F', foreground='#00e5ff',
+                                font=('Segoe UI', 10, 'bold'))
+
     def on_entry_focus_in(self, event):
         """Handle focus in event for entry"""
         if self.expression_entry.get() == "Example: A AND (B OR NOT C)":
@@ -429,16 +777,48 @@ class TruthTableGenerator:
             messagebox.showwarning("Input Required", "Please enter a logical expression!")
             return
 
+        # The animation steps through the current table, which is about to be replaced
+        if self.animation_running:
+            self.stop_animation()
+
         try:
-            self.current_expression = LogicalExpression(expression_text)
-            self.create_truth_table()
-            self.analyze_expression()
+            # Keep the current expression until its table is known to be replaced
+            expression = LogicalExpression(expression_text)
+            n_vars = len(expression.variables)
+            if n_vars > MAX_TABLE_VARS:
+                if not messagebox.askyesno(
+                        "Large Expression",
+                        f"{n_vars} variables give {1 << n_vars:,} rows, more than the table can "
+                        f"display (limit: {MAX_TABLE_VARS} variables).\n\nRun analysis only?"):
+                    return
+                self.current_expression = expression
+                self._assignments = np.empty((0, 0), dtype=np.uint8)
+                self._finalize_truth_table(np.empty(0, dtype=np.uint8))
+                self._row_item_ids = []
+                self.tree.delete(*self.tree.get_children())
+                self.tree["columns"] = ()
+                self.analyze_expression_bitvec()
+            else:
+                self.current_expression = expression
+                self.create_truth_table()
+                self.analyze_expression()
             self.status_var.set(f"✅ Generated truth table for: {expression_text}")
             self.update_status_light("#4CAF50")
         except Exception as e:
             messagebox.showerror("Expression Error", f"Error parsing expression: {str(e)}")
             self.update_status_light("#F44336")
 
+    def _finalize_truth_table(self, results):
+        """Store the result column along with the plot colors and sizes derived from it"""
+        self._results = results
+        self._colors_for_plot = _TRUTH_RGBA[results]
+        self._sizes_3d = _SIZE_PALETTE_3D[results]
+
+    @property
+    def truth_table_data(self):
+        """Truth table rows as (values..., result) tuples, built from the column arrays"""
+        return [(*row, result) for row, result in zip(self._assignments.tolist(), self._results.tolist())]
+
     def update_status_light(self, color):
         """Update the status light color"""
         self.status_indicator.itemconfig(self.status_light, fill=color)
@@ -452,6 +832,7 @@ class TruthTableGenerator:
         n_vars = len(variables)
 
         # Clear existing tree
+        self._row_item_ids = []
         for item in self.tree.get_children():
             self.tree.delete(item)
 
@@ -464,135 +845,129 @@ class TruthTableGenerator:
             self.tree.heading(col, text=col, anchor=tk.CENTER)
             self.tree.column(col, width=100, anchor=tk.CENTER)
 
-        # Generate all combinations
-        self.truth_table_data = []
-        for combination in itertools.product([False, True], repeat=n_vars):
-            var_dict = dict(zip(variables, combination))
-            result = self.current_expression.evaluate(var_dict)
-
-            row = [int(val) for val in combination] + [result]
-            self.truth_table_data.append(row)
-
-            # Add to tree with color coding
-            item = self.tree.insert("", tk.END, values=row, tags=('normal',))
-
-            # Color code based on result
-            if result == 1:
-                self.tree.tag_configure('true', background='#1B5E20', foreground='white')
-                self.tree.item(item, tags=('true',))
-            else:
-                self.tree.tag_configure('false', background='#B71C1C', foreground='white')
-                self.tree.item(item, tags=('false',))
+        # Evaluate all combinations in one vectorized pass
+        combos, results = self.current_expression.evaluate_numpy()
+        self._assignments = combos
+        self._finalize_truth_table(results.astype(np.uint8))
+        rows = np.column_stack([combos, self._results]).tolist()
+
+        # Detach the tree while populating so Tk lays it out once
+        parent = self.tree.master
+        self.tree.pack_forget()
+        true_count = 0
+        insert = self.tree.insert
+        append_id = self._row_item_ids.append
+        try:
+            for row in rows:
+                result = row[-1]
+                true_count += result
+                append_id(insert("", "end", values=row, tags=('true' if result else 'false',)))
+        finally:
+            self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
+                           before=parent.pack_slaves()[0])
 
         # Add summary row (separate from data rows)
-        if self.truth_table_data:
-            true_count = sum(row[-1] for row in self.truth_table_data)
-            total_count = len(self.truth_table_data)
+        if rows:
+            total_count = len(rows)
             summary_text = f"True: {true_count}/{total_count} ({true_count / total_count:.1%})"
 
             summary_item = self.tree.insert("", tk.END,
                                             values=["" for _ in range(n_vars)] + [summary_text],
                                             tags=('summary',))
-            self.tree.tag_configure('summary', background='#37474F', foreground='#00e5ff',
-                                    font=('Segoe UI', 10, 'bold'))
 
     def analyze_expression(self):
         """Analyze the expression for tautologies, contradictions, etc."""
-        if not self.truth_table_data:
+        if not self._results.size:
             return
 
-        results = [row[-1] for row in self.truth_table_data]
-        true_count = sum(results)
-        total_count = len(results)
+        results = self._results
+        idxs = np.flatnonzero(results)[:5]
+        satisfying = self._assignments[idxs].tolist()
+        self.write_analysis(int(np.count_nonzero(results)), len(results), satisfying)
+
+    def analyze_expression_bitvec(self):
+        """Analyze the expression straight from its result bitvector, without a table"""
+        n_vars = len(self.current_expression.variables)
+        result = self.current_expression.evaluate_all()
+        true_count = result.bit_count()
+
+        # Decode the lowest set bits back into assignments
+        satisfying = []
+        remaining = result
+        while remaining and len(satisfying) < 5:
+            i = (remaining & -remaining).bit_length() - 1
+            satisfying.append([(i >> (n_vars - 1 - k)) & 1 for k in range(n_vars)])
+            remaining &= remaining - 1
+
+        self.write_analysis(true_count, 1 << n_vars, satisfying)
+
+    def write_analysis(self, true_count, total_count, satisfying):
+        """Write the analysis report given the true count and first satisfying assignments"""
         false_count = total_count - true_count
 
-        analysis = f"🔍 LOGICAL EXPRESSION ANALYSIS\n"
-        analysis += f"{'=' * 40}\n\n"
+        out = ["🔍 LOGICAL EXPRESSION ANALYSIS\n"]
+        out.append(f"{'=' * 40}\n\n")
 
-        analysis += f"📝 Expression: {self.current_expression.expression}\n"
-        analysis += f"🔤 Variables: {', '.join(self.current_expression.variables)}\n"
-        analysis += f"📊 Total combinations: {total_count}\n\n"
+        out.append(f"📝 Expression: {self.current_expression.expression}\n")
+        out.append(f"🔤 Variables: {', '.join(self.current_expression.variables)}\n")
+        out.append(f"📊 Total combinations: {total_count}\n\n")
 
         # Statistics with progress bars
         true_percent = true_count / total_count * 100
         false_percent = false_count / total_count * 100
 
-        analysis += f"✅ True assignments: {true_count}\n"
-        analysis += f"   █" * int(true_percent / 5) + f" {true_percent:.1f}%\n\n"
+        out.append(f"✅ True assignments: {true_count}\n")
+        out.append(f"   {'█' * int(true_percent / 5)} {true_percent:.1f}%\n\n")
 
-        analysis += f"❌ False assignments: {false_count}\n"
-        analysis += f"   █" * int(false_percent / 5) + f" {false_percent:.1f}%\n\n"
+        out.append(f"❌ False assignments: {false_count}\n")
+        out.append(f"   {'█' * int(false_percent / 5)} {false_percent:.1f}%\n\n")
 
         # Classification with emojis
-        analysis += "🏷️  CLASSIFICATION:\n"
+        out.append("🏷️  CLASSIFICATION:\n")
         if true_count == total_count:
-            analysis += "   🟢 TAUTOLOGY (always true)\n"
-            analysis += "   📝 All possible assignments yield True\n\n"
+            out.append("   🟢 TAUTOLOGY (always true)\n")
+            out.append("   📝 All possible assignments yield True\n\n")
         elif false_count == total_count:
-            analysis += "   🔴 CONTRADICTION (always false)\n"
-            analysis += "   📝 All possible assignments yield False\n\n"
+            out.append("   🔴 CONTRADICTION (always false)\n")
+            out.append("   📝 All possible assignments yield False\n\n")
         else:
-            analysis += "   🟡 CONTINGENCY\n"
-            analysis += "   📝 Expression depends on variable values\n\n"
+            out.append("   🟡 CONTINGENCY\n")
+            out.append("   📝 Expression depends on variable values\n\n")
 
         # Satisfiability
-        analysis += "🔍 SATISFIABILITY:\n"
+        out.append("🔍 SATISFIABILITY:\n")
         if true_count > 0:
-            analysis += "   ✅ SATISFIABLE\n"
-            analysis += "   📊 Satisfying assignments found\n\n"
+            out.append("   ✅ SATISFIABLE\n")
+            out.append("   📊 Satisfying assignments found\n\n")
 
             # Show first few satisfying assignments
-            analysis += "   📋 Satisfying assignments:\n"
-            count = 0
-            for i, row in enumerate(self.truth_table_data):
-                if row[-1] == 1 and count < 5:
-                    assignment = ", ".join(f"{var}={val}"
-                                           for var, val in zip(self.current_expression.variables, row[:-1]))
-                    analysis += f"   • {assignment}\n"
-                    count += 1
+            out.append("   📋 Satisfying assignments:\n")
+            for row in satisfying:
+                assignment = ", ".join(f"{var}={val}"
+                                       for var, val in zip(self.current_expression.variables, row))
+                out.append(f"   • {assignment}\n")
             if true_count > 5:
-                analysis += f"   ... and {true_count - 5} more\n\n"
+                out.append(f"   ... and {true_count - 5} more\n\n")
         else:
-            analysis += "   ❌ UNSATISFIABLE\n"
-            analysis += "   📊 No satisfying assignments exist\n\n"
+            out.append("   ❌ UNSATISFIABLE\n")
+            out.append("   📊 No satisfying assignments exist\n\n")
 
         # Logical properties
-        analysis += "⚡ LOGICAL PROPERTIES:\n"
+        out.append("⚡ LOGICAL PROPERTIES:\n")
         if len(self.current_expression.variables) == 2:
             pattern = self.identify_binary_operation()
-            analysis += f"   • {pattern}\n"
+            out.append(f"   • {pattern}\n")
 
         # Complexity
-        analysis += f"\n📈 Expression complexity: {'★' * min(len(self.current_expression.variables), 5)}\n"
+        out.append(f"\n📈 Expression complexity: {'★' * min(len(self.current_expression.variables), 5)}\n")
 
         self.analysis_text.delete(1.0, tk.END)
-        self.analysis_text.insert(1.0, analysis)
+        self.analysis_text.insert(1.0, "".join(out))
 
     def identify_binary_operation(self):
         """Identify the type of binary operation"""
-        results = [row[-1] for row in self.truth_table_data]
-
-        operations = {
-            (0, 0, 0, 0): "Contradiction (False)",
-            (0, 0, 0, 1): "Conjunction (AND)",
-            (0, 0, 1, 0): "Material non-implication",
-            (0, 0, 1, 1): "First projection",
-            (0, 1, 0, 0): "Converse non-implication",
-            (0, 1, 0, 1): "Second projection",
-            (0, 1, 1, 0): "Exclusive disjunction (XOR)",
-            (0, 1, 1, 1): "Disjunction (OR)",
-            (1, 0, 0, 0): "Joint denial (NOR)",
-            (1, 0, 0, 1): "Biconditional (XNOR)",
-            (1, 0, 1, 0): "Negation (NOT B)",
-            (1, 0, 1, 1): "Converse implication",
-            (1, 1, 0, 0): "Negation (NOT A)",
-            (1, 1, 0, 1): "Material implication",
-            (1, 1, 1, 0): "Alternative denial (NAND)",
-            (1, 1, 1, 1): "Tautology (True)"
-        }
-
-        pattern = tuple(results)
-        return operations.get(pattern, "Custom operation")
+        results = self._results
+        return BIN_OPS[int(np.packbits(results, bitorder='little')[0])]
 
     def toggle_animation(self):
         """Toggle animation on/off"""
@@ -603,7 +978,7 @@ class TruthTableGenerator:
 
     def start_animation(self):
         """Start animated evaluation of the truth table"""
-        if not self.current_expression or not self.truth_table_data:
+        if not self.current_expression or not self._results.size:
             messagebox.showinfo("Animation", "Please generate a truth table first!")
             return
 
@@ -617,68 +992,61 @@ class TruthTableGenerator:
         self.progress_var.set(0)
         self.tree.clear_highlights()
 
-        # Start animation in separate thread
-        self.animation_thread = threading.Thread(target=self.run_animation, daemon=True)
-        self.animation_thread.start()
-
-    def run_animation(self):
-        """Run the animation sequence"""
-        items = list(self.tree.get_children())
+        # Rainbow palette: only six distinct hues are ever used
+        self._anim_colors = tuple(self.hsl_to_hex(h, 70, 50) for h in range(0, 360, 60))
 
-        # Filter out summary row from animation items
-        animation_items = []
-        animation_data_indices = []
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 35)
+        self._visible_rows = max(1, self.tree.winfo_height() // row_height)
+        self._last_seen_idx = -1
 
-        for i, item in enumerate(items):
-            # Skip summary row (last item)
-            if i < len(self.truth_table_data):
-                animation_items.append(item)
-                animation_data_indices.append(i)
+        self._anim_step(0)
 
-        total_items = len(animation_items)
+    def _anim_step(self, idx):
+        """Run one animation step and schedule the next on the Tk event loop"""
+        self.animation_after_id = None
+        if not self.animation_running:
+            return
 
-        for idx, (item, data_idx) in enumerate(zip(animation_items, animation_data_indices)):
-            if not self.animation_running:
-                break
+        items = self._row_item_ids
+        total_items = len(items)
 
-            # Update progress
-            progress = (idx + 1) / total_items * 100
-            self.root.after(0, lambda p=progress: self.progress_var.set(p))
+        # Remove highlight from the previous row
+        if 0 < idx < total_items:
+            self.tree.item(items[idx - 1], tags=())
 
-            # Get row data (use data_idx to access truth_table_data)
-            if data_idx < len(self.truth_table_data):
-                row_data = self.truth_table_data[data_idx]
+        if idx >= total_items:
+            self.animation_complete()
+            return
 
-                # Highlight current row with animation effect
-                self.root.after(0, lambda it=item, i=idx: self.animate_row(it, i))
+        # Highlight current row with animation effect
+        self.animate_row(items[idx], idx)
+        self.report_anim_step(idx, total_items)
 
-                # Show evaluation info
-                assignment = ", ".join(f"{var}={val}"
-                                       for var, val in zip(self.current_expression.variables, row_data[:-1]))
+        self.animation_after_id = self.root.after(int(self.animation_speed * 1000),
+                                                  self._anim_step, idx + 1)
 
-                result_text = "✅ True" if row_data[-1] == 1 else "❌ False"
-                status_text = f"🎬 Step {idx + 1}/{total_items}: {assignment} → {result_text}"
-                self.root.after(0, lambda st=status_text: self.status_var.set(st))
+    def report_anim_step(self, idx, total_items):
+        """Show animation progress and the row being evaluated"""
+        self.progress_var.set((idx + 1) / total_items * 100)
 
-                time.sleep(self.animation_speed)
+        assignment = ", ".join(f"{var}={val}"
+                               for var, val in zip(self.current_expression.variables,
+                                                   self._assignments[idx].tolist()))
 
-                # Remove highlight after delay
-                if idx < total_items - 1:
-                    time.sleep(0.1)
-                    self.root.after(0, lambda it=item: self.tree.item(it, tags=()))
-
-        if self.animation_running:
-            self.root.after(0, self.animation_complete)
+        result_text = "✅ True" if self._results[idx] == 1 else "❌ False"
+        self.status_var.set(f"🎬 Step {idx + 1}/{total_items}: {assignment} → {result_text}")
 
     def animate_row(self, item, step):
         """Animate a single row highlight"""
-        # Calculate color based on step (rainbow effect)
-        hue = (step * 60) % 360
-        color = self.hsl_to_hex(hue, 70, 50)
+        # Pick color based on step (rainbow effect)
+        color = self._anim_colors[step % 6]
 
         self.tree.highlight_row(item, color)
-        self.tree.see(item)
-        self.tree.selection_set(item)
+
+        # Scroll only when the row is about to leave the window, moving it to the top
+        if self._last_seen_idx < 0 or step - self._last_seen_idx >= self._visible_rows - 2:
+            self.tree.yview_moveto(step / (len(self._row_item_ids) + 1))
+            self._last_seen_idx = step
 
     def hsl_to_hex(self, h, s, l):
         """Convert HSL color to hex"""
@@ -717,9 +1085,8 @@ class TruthTableGenerator:
         self.update_status_light("#4CAF50")
 
         # Flash all true rows
-        items = list(self.tree.get_children())
-        for i, item in enumerate(items):
-            if i < len(self.truth_table_data) and self.truth_table_data[i][-1] == 1:
+        for item, result in zip(self._row_item_ids, self._results.tolist()):
+            if result == 1:
                 self.tree.highlight_row(item, "#4CAF50")
 
         # Show completion message
@@ -729,56 +1096,105 @@ class TruthTableGenerator:
     def stop_animation(self):
         """Stop the animation"""
         self.animation_running = False
+        if self.animation_after_id is not None:
+            self.root.after_cancel(self.animation_after_id)
+            self.animation_after_id = None
         self.status_var.set("⏹️ Animation stopped")
         self.update_status_light("#F44336")
         self.progress_var.set(0)
 
     def show_3d_visualization(self):
         """Show 3D visualization of the truth table"""
-        if not self.current_expression or not self.truth_table_data:
+        if not self.current_expression or not self._results.size:
             messagebox.showinfo("Visualization",
                                 "Please generate a truth table first!")
             return
 
+        self._load_matplotlib()
         self.create_3d_plot()
 
+    def _load_matplotlib(self):
+        """Import matplotlib on first use; most sessions never open a plot"""
+        if self._Figure is not None:
+            return
+
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 (registers the '3d' projection)
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+
+        self._Figure = Figure
+        self._FigureCanvasTkAgg = FigureCanvasTkAgg
+        self._NavigationToolbar2Tk = NavigationToolbar2Tk
+        self._Line3DCollection = Line3DCollection
+        self._Poly3DCollection = Poly3DCollection
+
     def create_3d_plot(self):
         """Create enhanced 3D plot of truth table data"""
-        plt.close('all')
+        n_vars = len(self.current_expression.variables)
 
-        # Clear previous canvas
-        for widget in self.viz_canvas_frame.winfo_children():
-            widget.destroy()
+        # One figure is reused for every view; only its axes are rebuilt
+        if self._fig is None:
+            self._fig = self._Figure(figsize=(12, 8), facecolor='#1e1e1e', dpi=100)
 
-        n_vars = len(self.current_expression.variables)
+        # A constant result column has nothing to plot point by point
+        results = self._results
+        if results.min() == results.max():
+            self._show_constant_visualization(bool(results[0]))
+            return
+
+        # Same hypercube layout as last time: recolor the existing scatter in place
+        if self._scatter3d is not None and self._scatter_vars == n_vars:
+            self.update_hypercube_projection()
+            self.embed_plot(self._fig)
+            return
+
+        self._fig.clf()
+        self._scatter3d = None
 
         if n_vars == 1:
-            self.create_1d_visualization()
-        elif n_vars == 2:
-            self.create_2d_3d_plot()
-        elif n_vars == 3:
-            self.create_3d_cube_plot()
+            ax = self._fig.add_subplot(111, facecolor='#1e1e1e')
+            self.create_1d_visualization(ax)
         else:
-            self.create_hypercube_projection()
+            ax = self._fig.add_subplot(111, projection='3d', facecolor='#1e1e1e')
+            if n_vars == 2:
+                self.create_2d_3d_plot(ax)
+            elif n_vars == 3:
+                self.create_3d_cube_plot(ax)
+            else:
+                self.create_hypercube_projection(ax)
 
-    def create_1d_visualization(self):
-        """Create visualization for 1 variable"""
-        fig = plt.figure(figsize=(10, 6), facecolor='#1e1e1e', dpi=100)
-        ax = fig.add_subplot(111, facecolor='#1e1e1e')
+        self.embed_plot(self._fig)
 
-        # Create bar chart
-        x = [0, 1]
-        results = [0, 0]
+    def _show_constant_visualization(self, value):
+        """Show a text summary for a tautology or contradiction instead of a plot"""
+        self._fig.clf()
+        self._scatter3d = None
+        ax = self._fig.add_subplot(111, facecolor='#1e1e1e')
+        ax.set_axis_off()
 
-        for row in self.truth_table_data:
-            results[row[0]] = row[-1]  # Store the result for each input
+        label = "Tautology: always True" if value else "Contradiction: always False"
+        ax.text(0.5, 0.55, label, color=_TRUTH_PALETTE[int(value)], fontsize=24,
+                fontweight='bold', ha='center', va='center', transform=ax.transAxes)
+        ax.text(0.5, 0.42, f"{self.current_expression.expression}\n"
+                           f"{len(self._results):,} rows, all {'1' if value else '0'}",
+                color='white', fontsize=14, ha='center', va='center', transform=ax.transAxes)
 
-        colors = ['#F44336' if r == 0 else '#4CAF50' for r in results]
+        self.embed_plot(self._fig)
+
+    def create_1d_visualization(self, ax):
+        """Create visualization for 1 variable"""
+        # Create bar chart
+        x = [0, 1]
+        # Result for each input value, ordered by that value
+        order = np.argsort(self._assignments[:, 0])
+        results = self._results[order]
+        colors = self._colors_for_plot[order]
         bars = ax.bar(x, [1, 1], color=colors, alpha=0.7, width=0.6)
 
         # Add value labels
         for i, (bar, r) in enumerate(zip(bars, results)):
-            color = 'white' if results[i] == 1 else '#aaa'
+            color = 'white' if r == 1 else '#aaa'
             ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1,
                     f"f({i}) = {r}", ha='center', va='bottom',
                     color=color, fontweight='bold', fontsize=12)
@@ -794,43 +1210,36 @@ class TruthTableGenerator:
         ax.tick_params(colors='white')
         ax.grid(True, alpha=0.3, color='#444')
 
-        self.embed_plot(fig)
-
-    def create_2d_3d_plot(self):
+    def create_2d_3d_plot(self, ax):
         """Create 3D visualization for 2 variables"""
-        fig = plt.figure(figsize=(12, 8), facecolor='#1e1e1e', dpi=100)
-        ax = fig.add_subplot(111, projection='3d', facecolor='#1e1e1e')
-
         # Create grid
         x = np.array([0, 0, 1, 1])
         y = np.array([0, 1, 0, 1])
-        z = np.array([row[-1] for row in self.truth_table_data])
-
-        # Color points based on truth value with gradient
-        colors = ['#F44336' if val == 0 else '#4CAF50' for val in z]
-        sizes = [300 if val == 1 else 200 for val in z]
+        z = self._results
+        colors = self._colors_for_plot
+        sizes = self._sizes_3d
 
         # Create 3D scatter plot
         scatter = ax.scatter(x, y, z, c=colors, s=sizes, alpha=0.8,
                              edgecolors='white', linewidth=2, depthshade=True)
 
-        # Create connecting lines
-        for i in range(len(x)):
-            ax.plot([x[i], x[i]], [y[i], y[i]], [0, z[i]],
-                    color=colors[i], linewidth=3, alpha=0.6, linestyle='--')
+        # Stems from the floor up to each point as one collection of (4, 2, 3) segments
+        tops = np.column_stack([x, y, z])
+        bases = np.column_stack([x, y, np.zeros_like(z)])
+        stems = self._Line3DCollection(np.stack([bases, tops], axis=1), colors=colors,
+                                       linewidths=3, alpha=0.6, linestyles='--')
+        ax.add_collection3d(stems)
 
-        # Create surface if we have all points
+        # Surface over the four points as two triangles, each colored by its mean height
         if len(x) == 4:
-            X, Y = np.meshgrid([0, 1], [0, 1])
-            Z = np.array(z).reshape(2, 2)
-            surf = ax.plot_surface(X, Y, Z, alpha=0.3, cmap='RdYlGn',
-                                   edgecolor='white', linewidth=0.5)
+            verts = np.column_stack([x, y, z])[[[0, 2, 3], [0, 3, 1]]]
+            face_colors = _TRUTH_RGBA[(verts[:, :, 2].mean(axis=1) >= 0.5).astype(np.intp)]
+            surf = self._Poly3DCollection(verts, facecolors=face_colors, alpha=0.3,
+                                          edgecolor='white', linewidth=0.5)
+            ax.add_collection3d(surf)
 
         # Add labels with truth values
-        for i, (xi, yi, zi) in enumerate(zip(x, y, z)):
-            label = f"{int(zi)}"
-            ax.text(xi, yi, zi + 0.1, label, color='white',
-                    fontsize=12, fontweight='bold', ha='center')
+        self._annotate_points(ax, x, y, z, z.astype(str), 'white')
 
         ax.set_xlabel(self.current_expression.variables[0], color='white', fontsize=12)
         ax.set_ylabel(self.current_expression.variables[1], color='white', fontsize=12)
@@ -853,42 +1262,24 @@ class TruthTableGenerator:
         ax.set_ylim(-0.5, 1.5)
         ax.set_zlim(-0.1, 1.1)
 
-        self.embed_plot(fig)
-
-    def create_3d_cube_plot(self):
+    def create_3d_cube_plot(self, ax):
         """Create 3D cube visualization for 3 variables"""
-        fig = plt.figure(figsize=(12, 8), facecolor='#1e1e1e', dpi=100)
-        ax = fig.add_subplot(111, projection='3d', facecolor='#1e1e1e')
-
-        vertices = []
-        colors = []
-
-        for row in self.truth_table_data:
-            x, y, z = row[:3]
-            result = row[-1]
-            vertices.append([x, y, z])
-            colors.append('#4CAF50' if result == 1 else '#F44336')
-
-        vertices = np.array(vertices)
+        vertices = self._assignments[:, :3].astype(float)
+        results = self._results
+        colors = self._colors_for_plot
 
         # Plot vertices
         scatter = ax.scatter(vertices[:, 0], vertices[:, 1], vertices[:, 2],
-                             c=colors, s=400, alpha=0.8, edgecolors='white', linewidth=2, depthshade=True)
-
-        # Draw cube edges
-        edges = [
-            [0, 1], [0, 2], [0, 4], [1, 3], [1, 5], [2, 3],
-            [2, 6], [3, 7], [4, 5], [4, 6], [5, 7], [6, 7]
-        ]
+                             c=colors, s=400, alpha=0.8, edgecolors='white', linewidth=2, depthshade=False)
 
-        for edge in edges:
-            points = vertices[edge]
-            ax.plot3D(*points.T, 'white', alpha=0.3, linewidth=1, linestyle=':')
+        # Draw cube edges as one collection of (12, 2, 3) segments
+        edges = self._Line3DCollection(vertices[self.CUBE_EDGES], colors='white',
+                                       alpha=0.3, linewidths=1, linestyles=':')
+        ax.add_collection3d(edges)
 
         # Label vertices with their truth values
-        for i, (vertex, color, row) in enumerate(zip(vertices, colors, self.truth_table_data)):
-            ax.text(vertex[0], vertex[1], vertex[2] + 0.1,
-                    str(row[-1]), color=color, fontsize=12, fontweight='bold', ha='center')
+        self._annotate_points(ax, vertices[:, 0], vertices[:, 1], vertices[:, 2],
+                              results.astype(str), colors)
 
         ax.set_xlabel(self.current_expression.variables[0], color='white', fontsize=12)
         ax.set_ylabel(self.current_expression.variables[1], color='white', fontsize=12)
@@ -906,52 +1297,41 @@ class TruthTableGenerator:
         # Set view angle
         ax.view_init(elev=25, azim=45)
 
-        self.embed_plot(fig)
-
-    def create_hypercube_projection(self):
+    def create_hypercube_projection(self, ax):
         """Create hypercube projection for 4+ variables"""
-        fig = plt.figure(figsize=(12, 8), facecolor='#1e1e1e', dpi=100)
-        ax = fig.add_subplot(111, projection='3d', facecolor='#1e1e1e')
-
         n_vars = len(self.current_expression.variables)
 
-        # Create positions using multidimensional scaling
-        positions = []
-        colors = []
-        sizes = []
-
-        for row in self.truth_table_data:
-            # Use PCA-like projection to 3D
-            if n_vars >= 3:
-                # Weighted sum for projection
-                x = row[0] * 1.0 + row[1] * 0.5 + row[2] * 0.2
-                y = row[1] * 1.0 + row[0] * 0.5 + row[2] * 0.2
-                z = row[2] * 1.0 + row[0] * 0.2 + row[1] * 0.2
-
-                # Add contribution from other variables
-                for i in range(3, min(n_vars, 6)):
-                    weight = 0.1 / (i - 1)
-                    x += row[i] * weight
-                    y += row[i] * weight * 0.7
-                    z += row[i] * weight * 0.3
-            else:
-                x, y, z = row[0], row[1] if n_vars > 1 else 0, 0
-
-            positions.append([x, y, z])
-            colors.append('#4CAF50' if row[-1] == 1 else '#F44336')
-            sizes.append(300 if row[-1] == 1 else 200)
-
-        positions = np.array(positions)
-
-        # Create scatter plot
-        scatter = ax.scatter(positions[:, 0], positions[:, 1], positions[:, 2],
-                             c=colors, s=sizes, alpha=0.8, edgecolors='white', linewidth=2, depthshade=True)
+        # Large tables plot a sample of rows; the tree and analysis still cover all of them
+        rows = plot_sample_rows(n_vars)
+        if rows is None:
+            assignments, results = self._assignments, self._results
+        else:
+            assignments, results = self._assignments[rows], self._results[rows]
+
+        # PCA-like projection to 3D as one float32 matmul over the first six variables
+        k = min(n_vars, 6)
+        positions = assignments[:, :k].astype(np.float32) @ hypercube_weights(k)
+        style = dict(alpha=0.8, edgecolors='white', linewidth=2, depthshade=False)
+
+        if n_vars >= HYPERCUBE_SPLIT_VARS:
+            # Uniform color and size per scatter lets matplotlib stamp one marker for all points
+            for value in (0, 1):
+                points = positions[results == value]
+                ax.scatter(points[:, 0], points[:, 1], points[:, 2],
+                           color=_TRUTH_RGBA[value], s=_SIZE_PALETTE_3D[value], **style)
+        else:
+            # Create scatter plot, kept so the next table with as many variables can reuse it
+            self._scatter3d = ax.scatter(positions[:, 0], positions[:, 1], positions[:, 2],
+                                         c=self._colors_for_plot, s=self._sizes_3d, **style)
+            self._scatter_vars = n_vars
 
         ax.set_xlabel('Dimension 1', color='white', fontsize=12)
         ax.set_ylabel('Dimension 2', color='white', fontsize=12)
         ax.set_zlabel('Dimension 3', color='white', fontsize=12)
 
         title = f'Hypercube Projection ({n_vars}D → 3D)'
+        if rows is not None:
+            title += f', {len(rows):,} of {len(self._results):,} rows'
         ax.set_title(title, color='white', fontsize=14, fontweight='bold', pad=20)
 
         # Style the plot
@@ -963,30 +1343,42 @@ class TruthTableGenerator:
         # Set view angle
         ax.view_init(elev=20, azim=30)
 
-        self.embed_plot(fig)
+    def update_hypercube_projection(self):
+        """Recolor the cached hypercube scatter; positions depend only on the variable count"""
+        self._scatter3d.set_facecolor(self._colors_for_plot)
+        self._scatter3d.set_sizes(self._sizes_3d)
+
+    @staticmethod
+    def _annotate_points(ax, xs, ys, zs, labels, colors):
+        """Label 3D points just above themselves"""
+        if isinstance(colors, str):
+            colors = [colors] * len(xs)
+        for x, y, z, label, color in zip(xs, ys, zs, labels, colors):
+            ax.text(x, y, z + 0.1, label, color=color, fontsize=12, fontweight='bold', ha='center')
 
     def embed_plot(self, fig):
         """Embed matplotlib plot in tkinter"""
-        if self.canvas:
-            try:
-                self.canvas.get_tk_widget().destroy()
-            except:
-                pass
-
-        self.canvas = FigureCanvasTkAgg(fig, self.viz_canvas_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-        # Add toolbar
-        if self.toolbar:
-            try:
-                self.toolbar.destroy()
-            except:
-                pass
-
-        self.toolbar = NavigationToolbar2Tk(self.canvas, self.viz_canvas_frame)
+        # Only a different figure needs a new canvas; drop the widgets we created for the old one
+        if self.canvas is not None and self.canvas.figure is not fig:
+            self._canvas_widget.destroy()
+            self.toolbar.destroy()
+            self.canvas = self._canvas_widget = self.toolbar = None
+
+        # Canvas and toolbar are created once, later views only redraw
+        if self.canvas is None:
+            self.canvas = self._FigureCanvasTkAgg(fig, self.viz_canvas_frame)
+            self.canvas.draw()
+            self._canvas_widget = self.canvas.get_tk_widget()
+            self._canvas_widget.pack(fill=tk.BOTH, expand=True)
+
+            # Add toolbar
+            self.toolbar = self._NavigationToolbar2Tk(self.canvas, self.viz_canvas_frame)
+            self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+        else:
+            self.canvas.draw_idle()
+
+        # Reset the toolbar's view history for the new axes
         self.toolbar.update()
-        self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Switch to visualization tab
         self.notebook.select(1)  # Index 1 is the visualization tab
@@ -995,22 +1387,32 @@ class TruthTableGenerator:
         """Clear all data and reset the interface"""
         self.expression_var.set("")
         self.current_expression = None
-        self.truth_table_data = []
+        self._assignments = np.empty((0, 0), dtype=np.uint8)
+        self._finalize_truth_table(np.empty(0, dtype=np.uint8))
 
         # Stop any running animation
         self.stop_animation()
 
         # Clear tree
         self.tree.clear_highlights()
+        self._row_item_ids = []
         for item in self.tree.get_children():
             self.tree.delete(item)
 
+        # Release memoized assignment matrices
+        assignment_matrix.cache_clear()
+
         # Clear analysis
         self.analysis_text.delete(1.0, tk.END)
 
-        # Clear visualization
-        for widget in self.viz_canvas_frame.winfo_children():
-            widget.destroy()
+        # Clear visualization, keeping the canvas and toolbar for the next plot
+        if self._fig is not None:
+            self._fig.clf()
+            self._scatter3d = None
+        # The figure can exist without a canvas if the first plot failed before embedding
+        if self.canvas is not None:
+            self.canvas.draw_idle()
+            self.toolbar.update()
 
         # Reset progress
         self.progress_var.set(0)